@@ -2,11 +2,12 @@
 
 # External Dependencies
 from selenium.webdriver.remote.webdriver import WebDriver
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pprint import pformat
 from tqdm import tqdm
-from typing import List
+from typing import List, Tuple
 from time import sleep
+import hashlib
 import csv
 
 # Internal Dependencies
@@ -14,6 +15,7 @@ from utilities.generic_validators import GenericValidators
 from utilities.scraper_builder import ScraperBuilder, Scraper
 from utilities.custom_exceptions import ScraperExceptions as SE
 from utilities.selenium_handler import BrowserManager
+from utilities.page_cache import PageCache
 from utilities.config_builder import Config
 from utilities.logger_formats import Log
 from utilities.settings import Settings
@@ -47,70 +49,140 @@ def save_data(scraper: Scraper, output_name: str, entry_name: str, entry_url: st
                 raise SE.UnexpectedData('Fieldnames and parsed_data keys do not match!')
             writer.writerow(parsed_data)
 
-def extract_data(page_html: str, scraper: Scraper, settings: Settings) -> List[List[str]]:
-    ''' Purpose: Controls selenium to scrape data from given page, returns page data_blocks. '''
-    soup = BeautifulSoup(page_html, 'html.parser')
-    texts = scraper.parsers.extract_page_text(soup)
+def extract_from_texts(texts: List[str], scraper: Scraper, settings: Settings) -> List[List[str]]:
+    ''' Returns: Validated data_blocks found in the given page texts list. '''
     indices = scraper.parsers.extract_data_indices(texts)
-    data_bounds, data_blocks = [], []
+    previous_bound, data_blocks = None, []
     for idx in indices:
         data_bound = scraper.parsers.extract_data_bounds(idx)
         SE.handle_bad_data(GenericValidators.validate_data_bound, settings.DATA_STRICT, data_bound, texts)
-        SE.handle_bad_data(GenericValidators.validate_for_overlap, settings.DATA_STRICT, data_bounds, data_bound)
+        if previous_bound is not None:
+            SE.handle_bad_data(GenericValidators.validate_for_overlap, settings.DATA_STRICT, previous_bound, data_bound)
         data_block = scraper.parsers.extract_data_block(texts, data_bound)
         SE.handle_bad_data(scraper.validators.validate_data_block, settings.DATA_STRICT, data_block)
         data_blocks.append(data_block)
-        data_bounds.append(data_bound)
+        previous_bound = data_bound
     return data_blocks
 
-def scrape_data(driver: WebDriver, scraper: Scraper, settings: Settings) -> List[List[str]]:
-    ''' Purpose: Controls selenium to scrape all pages for entry URL, returns URL data_blocks. '''
-    pbar = tqdm(total=0)
+def extract_from_pages(pages: List[List[str]], scraper: Scraper, settings: Settings) -> List[List[str]]:
+    ''' Returns: Validated data_blocks found across all page texts lists of an entry URL. '''
     data_blocks = []
+    for texts in pages:
+        data_blocks.extend(extract_from_texts(texts, scraper, settings))
+    return data_blocks
+
+def scrape_data(driver: WebDriver, scraper: Scraper, settings: Settings) -> Tuple[List[List[str]], List[List[str]]]:
+    ''' Purpose: Controls selenium to scrape all pages for entry URL, returns texts list of each
+        page and URL data_blocks. Each page is extracted on a background thread whilst
+        selenium navigates to the next page, results are collected one page later. '''
+    pbar = tqdm(total=0)
+    pages, page_hashes, data_blocks = [], set(), []
+    pending = None
     try:
-        while True:
-            page_html = driver.page_source
-            data_blocks.extend(extract_data(page_html, scraper, settings))
-            if SE.handle_bad_nav(scraper.navigators.check_next_page, driver):
-                SE.handle_bad_nav(scraper.navigators.grab_next_page, driver)
-                pbar.update(1)
-                SE.handle_bad_nav(scraper.navigators.wait_for_page, driver)
-                sleep(settings.RATE_LIMIT_DELAY)
-            else:
-                break
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while True:
+                texts = scraper.parsers.extract_page_text(driver)
+                page_hash = hashlib.sha1('\x1f'.join(texts).encode('utf-8')).hexdigest()
+                SE.handle_bad_data(GenericValidators.validate_unique_page, settings.DATA_STRICT, page_hash, page_hashes)
+                if page_hash not in page_hashes:
+                    if pending is not None:
+                        data_blocks.extend(pending.result())
+                    pending = executor.submit(extract_from_texts, texts, scraper, settings)
+                    pages.append(texts)
+                    page_hashes.add(page_hash)
+                if SE.handle_bad_nav(scraper.navigators.check_next_page, driver):
+                    SE.handle_bad_nav(scraper.navigators.grab_next_page, driver)
+                    pbar.update(1)
+                    SE.handle_bad_nav(scraper.navigators.wait_for_page, driver)
+                    sleep(settings.RATE_LIMIT_DELAY)
+                else:
+                    break
+            if pending is not None:
+                data_blocks.extend(pending.result())
     finally:
         pbar.close()
-    Log.status(f'Extracted {len(data_blocks)} reviews')
+    return pages, data_blocks
+
+def scrape_pages(driver: WebDriver, scraper: Scraper, entry_url: str, settings: Settings) -> Tuple[List[List[str]], List[List[str]], int]:
+    ''' Purpose: Controls selenium to scrape entry URL, returns texts list of each page,
+        URL data_blocks, and expected total number of data blocks. '''
+    driver.get(entry_url)
+    SE.handle_bad_nav(scraper.navigators.wait_for_entry, driver)
+    pages, data_blocks = scrape_data(driver, scraper, settings)
+    total_blocks = SE.handle_non_critical(scraper.parsers.extract_total_count, settings.DATA_STRICT, driver)
+    sleep(settings.RATE_LIMIT_DELAY)
+    return pages, data_blocks, total_blocks
+
+def scrape_entry(scraper: Scraper, entry_name: str, entry_url: str, settings: Settings, driver: WebDriver = None) -> List[List[str]]:
+    ''' Purpose: Extracts all data for a single entry URL, returns entry URL data_blocks.
+        Pages are read from the PageCache instead when a fresh copy exists. Without a
+        driver, as in pool worker processes, a Selenium session is opened for the entry. '''
+    Log.status(f'Scraping {entry_name}')
+    page_cache = PageCache(settings)
+    cached = page_cache.load(entry_url)
+    if cached is not None:
+        Log.info(f'Using cached pages for {entry_url}')
+        pages, total_blocks = cached
+        data_blocks = extract_from_pages(pages, scraper, settings)
+    elif driver is None:
+        with BrowserManager(language=scraper.parsers.browser_lang, settings=settings) as entry_driver:
+            pages, data_blocks, total_blocks = scrape_pages(entry_driver, scraper, entry_url, settings)
+    else:
+        pages, data_blocks, total_blocks = scrape_pages(driver, scraper, entry_url, settings)
+    Log.status(f'Extracted {len(data_blocks)} reviews for {entry_name}')
+    SE.handle_bad_data(GenericValidators.validate_data_count, settings.DATA_STRICT, len(data_blocks), total_blocks)
+    if cached is None and len(data_blocks) == total_blocks:
+        page_cache.save(entry_url, pages, total_blocks)
     return data_blocks
 
-def scrape_website(driver: WebDriver, scraper: Scraper, config: Config, settings: Settings, output_name: str):
-    ''' Purpose: Control Selenium to extract data for each entry URL. '''
-    for entry_name, entry_url in config.get_lines():
-        Log.status(f'Scraping {entry_name}')
+def scrape_website(scraper: Scraper, config: Config, settings: Settings, output_name: str):
+    ''' Purpose: Extract data for each entry URL. With one worker, a single Selenium session is
+        reused for all entries, otherwise entries are spread across a pool of worker processes
+        each with its own Selenium session. Results are saved in configuration order. '''
+    entries = config.get_lines()
+    for _, entry_url in entries:
         scraper.validators.validate_url(entry_url)
-        driver.get(entry_url)
-        SE.handle_bad_nav(scraper.navigators.wait_for_entry, driver)
-        data_blocks = scrape_data(driver, scraper, settings)
-        total_blocks = SE.handle_non_critical(scraper.parsers.extract_total_count, settings.DATA_STRICT, driver)
-        SE.handle_bad_data(GenericValidators.validate_data_count, settings.DATA_STRICT, len(data_blocks), total_blocks)
-        save_data(scraper, output_name, entry_name, entry_url, data_blocks, settings)
-        sleep(settings.RATE_LIMIT_DELAY)
+    if settings.SCRAPE_WORKERS == 1:
+        with BrowserManager(language=scraper.parsers.browser_lang, settings=settings) as driver:
+            for entry_name, entry_url in entries:
+                data_blocks = scrape_entry(scraper, entry_name, entry_url, settings, driver)
+                save_data(scraper, output_name, entry_name, entry_url, data_blocks, settings)
+        return
+    with ProcessPoolExecutor(max_workers=settings.SCRAPE_WORKERS) as executor:
+        futures = []
+        for entry_name, entry_url in entries:
+            futures.append(executor.submit(scrape_entry, scraper, entry_name, entry_url, settings))
+            sleep(settings.WORKER_START_DELAY / 1000)
+        try:
+            for (entry_name, entry_url), future in zip(entries, futures):
+                data_blocks = future.result()
+                save_data(scraper, output_name, entry_name, entry_url, data_blocks, settings)
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+def log_trace(e: BaseException):
+    ''' Purpose: Logs exception traceback. Exceptions re-raised from a worker process only carry
+        parent frames, so the worker traceback attached as __cause__ is logged as well. '''
+    Log.trace(e.__traceback__)
+    worker_traceback = getattr(e.__cause__, 'tb', None)
+    if isinstance(worker_traceback, str):
+        Log.trace(worker_traceback)
 
 def scrape_launch(config_file: str, output_name: str, settings: Settings):
     ''' Purpose: Manages the scraping of all pages from provided config file. '''
     try:
         config = Config(config_file)
         scraper = ScraperBuilder.build(f'scrapers.{config.scraper_name}')
-        with BrowserManager(language=scraper.parsers.browser_lang, settings=settings) as driver:
-            Log.info(f'Loaded {config_file} contents:\n{config.string()}')
-            scrape_website(driver, scraper, config, settings, output_name)
+        Log.info(f'Loaded {config_file} contents:\n{config.string()}')
+        scrape_website(scraper, config, settings, output_name)
         Log.status('Scraping executed successfully')
     except KeyboardInterrupt:
         raise KeyboardInterrupt
     except (FileNotFoundError, NotImplementedError, TimeoutError, ConnectionError, SE.InvalidConfigFile, SE.UnexpectedData, SE.BadScraper, SE.NavigationFail) as e:
         Log.alert(f'{e.args[0]}\nScraper:{config.scraper_name} {type(e).__name__}')
         if isinstance(e, (NotImplementedError, SE.UnexpectedData, SE.BadScraper, SE.NavigationFail)):
-            Log.trace(e.__traceback__)
+            log_trace(e)
     except Exception as e:
         Log.error(f'Unexpected error, could be internet...\nscraper:{config.scraper_name} {type(e).__name__}\n{e}')
-        Log.trace(e.__traceback__)
+        log_trace(e)
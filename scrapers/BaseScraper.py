@@ -2,7 +2,6 @@
 
 # External Dependencies
 from selenium.webdriver.remote.webdriver import WebDriver, WebElement
-from bs4 import BeautifulSoup
 import re
 from abc import ABC, abstractmethod
 from typing import List, Dict, Union
@@ -24,7 +23,7 @@ class BaseValidators(ABC):
 
     # Sibling instance inherited BaseParsers class methods:
     def validate_url(self, url: str) -> None:
-        if not re.compile(self.url_pattern).match(url):
+        if not self._url_regex.match(url):
             raise SE.InvalidConfigFile(f'JSON contains invalid URL format: {url}\n Given: {self.url_pattern}')
 
     # Enforce BaseValidators class attributes and abstract methods in sibling class:
@@ -32,6 +31,7 @@ class BaseValidators(ABC):
         super().__init_subclass__(**kwargs)
         check_required_class_attributes(BaseValidators, cls)
         check_required_abstract_methods(BaseValidators, cls)
+        cls._url_regex = re.compile(cls.url_pattern)
 
 class BaseParsers(ABC):
     ''' Base class for scraper-specific Parsers. '''
@@ -51,8 +51,8 @@ class BaseParsers(ABC):
     def extract_total_count(self, driver: WebDriver) -> int:
         ''' Returns: Total number of data blocks to be extracted for current entry URL. '''
     @abstractmethod
-    def extract_page_text(self, soup: BeautifulSoup) -> List[str]:
-        ''' Returns: List of HTML element texts strings extracted from page soup. '''
+    def extract_page_text(self, driver: WebDriver) -> List[str]:
+        ''' Returns: List of HTML element texts strings extracted from current page. '''
     @abstractmethod
     def parse_data_block(self, block: List[str]) -> Dict[str, Union[int, str]]:
         ''' Returns: Data block parsed to dictionary of data to save. '''
@@ -60,7 +60,12 @@ class BaseParsers(ABC):
     # Sibling instance inherited BaseParsers class methods:
     def extract_data_indices(self, texts: List[str]) -> List[int]:
         ''' Returns: List of indices of relevant data blocks in text list. '''
-        return [i for i, x in enumerate(texts) if re.search(self.text_pattern, x)]
+        if self._text_literal is not None:
+            # Plain string equality, matching how re treats $ before a final newline.
+            literal, literal_newline = self._text_literal, self._text_literal + '\n'
+            return [i for i, x in enumerate(texts) if x == literal or x == literal_newline]
+        search = self._text_regex.search
+        return [i for i, x in enumerate(texts) if search(x)]
     def extract_data_bounds(self, idx: int) -> Dict[str, int]:
         ''' Returns: Dict of start and end indices for relevant data block in list. '''
         start_idx = idx - self.text_idx
@@ -75,6 +80,8 @@ class BaseParsers(ABC):
         super().__init_subclass__(**kwargs)
         check_required_class_attributes(BaseParsers, cls)
         check_required_abstract_methods(BaseParsers, cls)
+        cls._text_regex = re.compile(cls.text_pattern)
+        cls._text_literal = extract_literal(cls.text_pattern)
 
 class BaseNavigators(ABC):
     ''' Base class for scraper-specific Navigators. '''
@@ -99,6 +106,12 @@ class BaseNavigators(ABC):
         check_required_class_attributes(BaseNavigators, cls)
         check_required_abstract_methods(BaseNavigators, cls)
 
+def extract_literal(pattern: str) -> Union[str, None]:
+    ''' Returns: Literal text of an anchored pattern without regex syntax (e.g. ^The good things$),
+        which can be matched with string equality, otherwise None. '''
+    literal_match = re.fullmatch(r'\^([^\\.^$*+?{}\[\]|()]*)\$', pattern)
+    return literal_match.group(1) if literal_match else None
+
 def check_required_class_attributes(base_class, sub_class):
     ''' Purpose: Validates that sibling of given class contains all class level attributes. '''
     base_attrs = {k: v for k, v in base_class.__annotations__.items() if not callable(v) and not k.startswith('_')}
@@ -7,7 +7,6 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webdriver import WebDriver, WebElement
-from bs4 import BeautifulSoup
 import re
 from typing import List, Dict, Union
 
@@ -15,19 +14,37 @@ from typing import List, Dict, Union
 from utilities.custom_exceptions import ScraperExceptions as SE
 from scrapers.BaseScraper import BaseValidators, BaseParsers, BaseNavigators
 
+DATA_GOOD_TEXT = 'The good things'
+DATA_YEAR_IDX = 21
+DATA_CHALLENGE_IDX = 27
+DATA_CHALLENGE_TEXT = 'The challenges'
+YEAR_PATTERN = re.compile(r'\d{4}')
+POSTCODE_PATTERN = re.compile(r'(\s|^)(\d{4})$')
+STATE_MAPPINGS = {
+    'VIC': ['VIC', 'Victoria'],
+    'NSW': ['NSW', 'New South Wales'],
+    'QLD': ['QLD', 'Queensland'],
+    'SA': ['SA', 'South Australia'],
+    'WA': ['WA', 'Western Australia'],
+    'TAS': ['TAS', 'Tasmania'],
+    'NT': ['NT', 'Northern Territory'],
+    'ACT': ['ACT', 'Australian Capital Territory']
+}
+# Check for the exact word or the abbreviation bounded by non-word characters or start/end of string
+STATE_PATTERNS = {
+    key: [re.compile(r'\b' + re.escape(name) + r'\b') for name in names + [name.lower() for name in names]]
+    for key, names in STATE_MAPPINGS.items()
+}
+
 class Validators(BaseValidators):
 
     url_pattern = r'https?://www\.seek\.com\.au/companies/.+/reviews'
 
     def validate_data_block(self, block: List) -> None:
         try:
-            year_pattern = re.compile(r"\d{4}")
-            data_year_idx = 21
-            if not year_pattern.match((block[data_year_idx].split()[1])):
+            if not YEAR_PATTERN.match(block[DATA_YEAR_IDX].split()[1]):
                 raise SE.UnexpectedData(f'Expected year at second block index:\n{block}')
-            challenge_text = 'The challenges'
-            data_challenge_idx = 27
-            if not block[data_challenge_idx] == challenge_text:
+            if not block[DATA_CHALLENGE_IDX] == DATA_CHALLENGE_TEXT:
                 raise SE.UnexpectedData(f'Expected challenge text at second last block index:\n{block}')
         except (IndexError, AttributeError):
             raise SE.UnexpectedData(f'Unexpected data format encountered:\n{block}')
@@ -35,7 +52,7 @@ class Validators(BaseValidators):
 class Parsers(BaseParsers):
 
     browser_lang = 'en-AU'
-    text_pattern = r'^The good things$'
+    text_pattern = f'^{DATA_GOOD_TEXT}$'
     text_idx = 25
     data_length = 29
 
@@ -44,43 +61,26 @@ class Parsers(BaseParsers):
         total_str = total_element.text
         return int(total_str.strip())
     
-    def extract_page_text(self, soup: BeautifulSoup) -> List[str]:
-        elements = soup.find_all(
-        lambda tag: (tag.name in ['span', 'h3']) or 
-                    (tag.name == 'div' and 'out of 5' in tag.get('aria-label', ''))
-        )
-        result = []
-        for element in elements:
-            if element.name in ['span', 'h3']:
-                result.append(element.get_text())
-            else:
-                result.append(element['aria-label'])
-        return result
+    def extract_page_text(self, driver: WebDriver) -> List[str]:
+        # Scope to the reviews container, the closest common ancestor of the first review and the Next button.
+        return driver.execute_script('''
+            const goodText = arguments[0];
+            const next = document.querySelector('a[aria-label="Next"]');
+            const first = Array.from(document.querySelectorAll('h3, span')).find(element => element.textContent === goodText);
+            let root = document;
+            if (next && first) {
+                root = next.parentElement;
+                while (!root.contains(first)) root = root.parentElement;
+            }
+            return Array.from(root.querySelectorAll('span, h3, div[aria-label*="out of 5"]')).map(
+                element => element.tagName === 'DIV' ? element.getAttribute('aria-label') : element.textContent);
+        ''', DATA_GOOD_TEXT)
     
     def parse_data_block(self, block: List[str]) -> Dict[str, Union[int, str]]:
         def parse_location(location: str):
-            state_mappings = {
-                'VIC': ['VIC', 'Victoria'],
-                'NSW': ['NSW', 'New South Wales'],
-                'QLD': ['QLD', 'Queensland'],
-                'SA': ['SA', 'South Australia'],
-                'WA': ['WA', 'Western Australia'],
-                'TAS': ['TAS', 'Tasmania'],
-                'NT': ['NT', 'Northern Territory'],
-                'ACT': ['ACT', 'Australian Capital Territory']
-            }
-            for key in state_mappings:
-                state_mappings[key].extend([name.lower() for name in state_mappings[key]])
-            postcode_match = re.search(r'(\s|^)(\d{4})$', location)
+            postcode_match = POSTCODE_PATTERN.search(location)
             postcode = postcode_match.group(2) if postcode_match else ''
-            states_found = []
-            for key, names in state_mappings.items():
-                for name in names:
-                    if name in location:
-                        # Check for the exact word or the abbreviation bounded by non-word characters or start/end of string
-                        if re.search(r'\b' + re.escape(name) + r'\b', location):
-                            states_found.append(key)
-                            break
+            states_found = [key for key, patterns in STATE_PATTERNS.items() if any(pattern.search(location) for pattern in patterns)]
             return location, ', '.join(states_found), postcode
         def parse_years_in_role(role_str: str) -> str:
             if 'Less than 1' in role_str:
@@ -119,29 +119,54 @@ class Parsers(BaseParsers):
 
 class Navigators(BaseNavigators):
 
-    @classmethod
+    next_button_selector = 'a[aria-label="Next"]'
+
+    def __init__(self):
+        # Per-session state, the Next button handle is reused until the page changes.
+        self.next_button = None
+        self.old_texts = []
+
     def grab_next_button(self, driver: WebDriver) -> WebElement:
-        return driver.find_element(By.XPATH, '//a[@aria-label="Next"]')
+        if self.next_button is None:
+            self.next_button = driver.find_element(By.CSS_SELECTOR, self.next_button_selector)
+        return self.next_button
     
+    def grab_heading_texts(self, driver: WebDriver) -> List[str]:
+        return driver.execute_script("return Array.from(document.getElementsByTagName('h3')).map(element => element.innerText);")
+
     def check_next_page(self, driver: WebDriver) -> bool:
-        next_button = self.grab_next_button(driver)
-        return next_button.get_attribute('tabindex') != '-1'
+        try:
+            return self.grab_next_button(driver).get_attribute('tabindex') != '-1'
+        except StaleElementReferenceException:
+            self.next_button = None  # Requeried when SE.handle_bad_nav retries
+            raise
     
     def grab_next_page(self, driver: WebDriver) -> None:
-        next_button = self.grab_next_button(driver)
-        next_button.click()
+        # Snapshot headings and start observing DOM mutations before the click so wait_for_page cannot miss the change.
+        self.old_texts = self.grab_heading_texts(driver)
+        driver.execute_script('''
+            window.pyscrapifyMutated = false;
+            new MutationObserver((mutations, observer) => {
+                window.pyscrapifyMutated = true;
+                observer.disconnect();
+            }).observe(document.body, {childList: true, subtree: true, characterData: true});
+        ''')
+        try:
+            self.grab_next_button(driver).click()
+        except StaleElementReferenceException:
+            self.next_button = None  # Requeried when SE.handle_bad_nav retries
+            raise
         
     def wait_for_entry(self, driver: WebDriver) -> None:
+        self.next_button = None
         wait = WebDriverWait(driver, 40)
-        wait.until(EC.presence_of_element_located((By.XPATH, "//a[@aria-label='Next']")))
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, self.next_button_selector)))
 
     def wait_for_page(self, driver: WebDriver) -> None:
-        old_texts = [elem.text for elem in driver.find_elements(By.TAG_NAME, 'h3')]
         def page_has_changed(driver: webdriver.Chrome) -> bool:
-            try:
-                current_texts = [elem.text for elem in driver.find_elements(By.TAG_NAME, 'h3')]
-                return current_texts != old_texts
-            except StaleElementReferenceException:
+            if driver.execute_script('return window.pyscrapifyMutated === false;'):
                 return False
-        wait = WebDriverWait(driver, 40)
+            return self.grab_heading_texts(driver) != self.old_texts
+        wait = WebDriverWait(driver, 40, poll_frequency=0.1)
         wait.until(page_has_changed)
+        self.next_button = None
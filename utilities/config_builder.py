@@ -4,7 +4,7 @@
 
 # External Dependencies
 import json
-from typing import List
+from typing import List, Tuple
 
 # Internal Dependencies
 from utilities.generic_validators import GenericValidators
@@ -12,22 +12,22 @@ from utilities.generic_validators import GenericValidators
 class Config:
     ''' Purpose: Load specified scrape_config contents. '''
     def __init__(self, config_file: str):
-        self.orgs = []
+        self.entries = []
         config_path = f'scrape_configs/{config_file}'
         GenericValidators.validate_file_exists(config_path)
         with open(config_path, 'r') as file:
             data = json.load(file)
-            GenericValidators.validate_json_structure(data)
-            self.scraper_name = data.get('scraper')
-            seen_urls = set()
-            for name, url in data['entries'].items():
-                GenericValidators.validate_name(name)
-                if url not in seen_urls:
-                    self.orgs.append({'name': name, 'url': url})
-                    seen_urls.add(url)
-    def get_lines(self) -> List:
+        GenericValidators.validate_json_structure(data)
+        self.scraper_name = data['scraper']
+        seen_urls = set()
+        for name, url in data['entries'].items():
+            GenericValidators.validate_name(name)
+            if url not in seen_urls:
+                self.entries.append((name, url))
+                seen_urls.add(url)
+    def get_lines(self) -> List[Tuple[str, str]]:
         ''' Returns: List of organisation names and URLs. '''
-        return [(org['name'], org['url']) for org in self.orgs]
+        return self.entries
     def string(self) -> str:
         ''' Returns: String of organisation names and URLs. '''
-        return '\n'.join([f'{org["name"]}: {org["url"]}' for org in self.orgs])
+        return '\n'.join(f'{name}: {url}' for name, url in self.entries)
@@ -1,7 +1,7 @@
 ''' Created: 14/09/2023 '''
 
 # External Dependencies:
-from typing import Dict, List
+from typing import Dict, List, Set
 import re, os, json
 
 # Internal Dependencies:
@@ -38,7 +38,7 @@ class GenericValidators:
     @staticmethod
     def validate_data_bound(data_bound: Dict[str, int], texts: List[List]):
         ''' Purpose: Validates if the data is within list bounds. '''
-        if not (data_bound['start_idx'] >= 0 and data_bound['end_idx'] < len(texts)):
+        if not (data_bound['start_idx'] >= 0 and data_bound['end_idx'] <= len(texts)):
             raise SE.UnexpectedData(f'Expected data block goes out of bounds:\n{texts}')
     @staticmethod
     def validate_data_count(actual_count: int, expected_count: int):
@@ -46,7 +46,13 @@ class GenericValidators:
         if actual_count != expected_count:
             raise SE.UnexpectedData(f'Expected {expected_count}, got {actual_count}...')
     @staticmethod
-    def validate_for_overlap(data_bounds: List[Dict[str, int]], new_data_bound: Dict[str, int]):
-        ''' Purpose: Validates if there is no overlaps in the ranges of any data bounds. '''
-        if any(existing_bound['start_idx'] < new_data_bound['end_idx'] and existing_bound['end_idx'] > new_data_bound['start_idx'] for existing_bound in data_bounds):
+    def validate_for_overlap(previous_bound: Dict[str, int], new_data_bound: Dict[str, int]):
+        ''' Purpose: Validates if there is no overlap between the ranges of consecutive data bounds.
+            Data bounds are built in ascending index order, so only the previous one can overlap. '''
+        if previous_bound['start_idx'] < new_data_bound['end_idx'] and previous_bound['end_idx'] > new_data_bound['start_idx']:
             raise SE.UnexpectedData("Overlapping data bounds detected.")
+    @staticmethod
+    def validate_unique_page(page_hash: str, page_hashes: Set[str]):
+        ''' Purpose: Validates page contents hash has not already been scraped for entry URL. '''
+        if page_hash in page_hashes:
+            raise SE.UnexpectedData('Duplicate page contents detected, navigation may have failed...')
@@ -36,8 +36,11 @@ class Log:
         print(f'{Log.PREFIX_ERROR} {Fore.LIGHTBLACK_EX}{message}{Style.RESET_ALL}')
     @staticmethod
     def trace(error_traceback):
-        ''' Formats: [!] TRACE: trace on next line '''
-        formatted_traceback = ''.join(traceback.format_tb(error_traceback))
+        ''' Formats: [!] TRACE: trace on next line, accepts a traceback or preformatted str. '''
+        if isinstance(error_traceback, str):
+            formatted_traceback = error_traceback
+        else:
+            formatted_traceback = ''.join(traceback.format_tb(error_traceback))
         print(f'{Log.PREFIX_TRACE}\n{Fore.LIGHTBLACK_EX}{formatted_traceback}{Style.RESET_ALL}')
     @staticmethod
     def dump(object):
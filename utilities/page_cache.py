@@ -0,0 +1,54 @@
+''' Created: 15/10/2026 '''
+
+# External Dependencies
+from typing import List, Optional, Tuple
+import hashlib, gzip, json, os, tempfile, time
+
+# Internal Dependencies
+from utilities.logger_formats import Log
+from utilities.settings import Settings
+
+class PageCache:
+    ''' Purpose: Store the scraped page texts of each entry URL on disk so repeat
+        runs within settings.CACHE_TTL seconds can skip the network entirely. '''
+    def __init__(self, settings: Settings):
+        self.directory = settings.CACHE_DIRECTORY
+        self.ttl = settings.CACHE_TTL
+    def get_path(self, entry_url: str) -> str:
+        ''' Returns: Cache file path for entry URL, keyed by URL sha1 hash. '''
+        url_hash = hashlib.sha1(entry_url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f'{url_hash}.json.gz')
+    def load(self, entry_url: str) -> Optional[Tuple[List[List[str]], Optional[int]]]:
+        ''' Returns: Tuple of cached page texts lists and total count for entry URL, or None
+            if caching is disabled or no unexpired valid cache file exists. Unreadable
+            cache files are deleted and treated as a cache miss. '''
+        if self.ttl <= 0:
+            return None
+        cache_path = self.get_path(entry_url)
+        if not os.path.exists(cache_path) or time.time() - os.path.getmtime(cache_path) > self.ttl:
+            return None
+        try:
+            with gzip.open(cache_path, 'rt', encoding='utf-8') as file:
+                data = json.load(file)
+            return data['pages'], data['total_count']
+        except (OSError, EOFError, gzip.BadGzipFile, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError) as e:
+            Log.warn(f'Discarding unreadable cache file {cache_path}: {type(e).__name__}')
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+            return None
+    def save(self, entry_url: str, pages: List[List[str]], total_count: Optional[int]):
+        ''' Purpose: Saves page texts lists and total count for entry URL to cache. Writes to
+            a temporary file first so an interrupted save never leaves a partial cache file. '''
+        if self.ttl <= 0:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as raw_file, gzip.open(raw_file, 'wt', encoding='utf-8') as file:
+                json.dump({'entry_url': entry_url, 'total_count': total_count, 'pages': pages}, file)
+            os.replace(temp_path, self.get_path(entry_url))
+        except BaseException:
+            os.remove(temp_path)
+            raise
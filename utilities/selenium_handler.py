@@ -3,24 +3,32 @@
 # External Dependencies
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.common.exceptions import TimeoutException
-from requests.exceptions import ChunkedEncodingError
+from selenium.common.exceptions import NoSuchDriverException, TimeoutException
 
 # Internal Dependencies
 from utilities.logger_formats import Log
 from utilities.settings import Settings
 
 class BrowserManager:
+    # URL patterns for assets scrapers never read, blocked via CDP to cut page load time.
+    BLOCKED_URL_PATTERNS = [
+        '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.ico',
+        '*.woff', '*.woff2', '*.ttf', '*.otf',
+        '*googletagmanager.com*', '*google-analytics.com*', '*doubleclick.net*'
+    ]
     def __init__(self, language: str, settings: Settings):
         self.header = settings.SELENIUM_HEADER
         self.logging = settings.SELENIUM_LOGGING
+        self.block_assets = settings.SELENIUM_BLOCK_ASSETS
         self.language = language
     def create_browser(self) -> WebDriver:
         ''' Returns: Created Selenium Chrome browser session. '''
         options = webdriver.ChromeOptions()
         options.add_argument(f'--lang={self.language}')
+        if self.block_assets:
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_argument('--disable-extensions')
         if not self.header:
             Log.info('Running Selenium driver without header...')
             options.add_argument('--headless')
@@ -28,14 +36,24 @@ class BrowserManager:
             Log.info('Disabled Selenium driver logging...')
             options.add_experimental_option('excludeSwitches', ['enable-logging'])
         try:
-            driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()), 
-                options=options)
+            # Selenium Manager resolves chromedriver, only downloading to ~/.cache/selenium on first use.
+            driver = webdriver.Chrome(service=Service(), options=options)
             return driver
-        except (ChunkedEncodingError, TimeoutException) as e:
+        except (NoSuchDriverException, TimeoutException) as e:
             raise ConnectionError(f'Failed due to {type(e).__name__}: check internet and try again.')
+    def block_asset_requests(self):
+        ''' Purpose: Blocks browser requests for BLOCKED_URL_PATTERNS assets via CDP. '''
+        Log.info('Blocking Selenium driver asset requests...')
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.BLOCKED_URL_PATTERNS})
     def __enter__(self):
         self.driver = self.create_browser()
+        if self.block_assets:
+            try:
+                self.block_asset_requests()
+            except Exception:
+                self.driver.quit()
+                raise
         return self.driver
     def __exit__(self, exc_type, *_):
         if exc_type is None or exc_type is KeyboardInterrupt:
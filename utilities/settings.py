@@ -26,23 +26,40 @@ class Settings:
         self.SELENIUM_LOGGING = False  # Type: bool, Default: False
         # If true, sets selenium browser to not be in headless mode.
         self.SELENIUM_HEADER = False  # Type: bool, Default: False
+        # If true, selenium browser skips loading images, fonts, analytics, and extensions.
+        self.SELENIUM_BLOCK_ASSETS = True  # Type: bool, Default: True
         # If true, dumps all raw data blocks to output textfile.
         self.DUMP_RAW_DATA = True  # Type: bool, Default: True
         # If true, on any suspect bad data issue, code will exit.
         self.DATA_STRICT = True # Type: bool, Default: True
+        # How many entry URLs to scrape in parallel, each in its own browser.
+        self.SCRAPE_WORKERS = 1  # Type: int, Default: 1
+        # How many seconds cached entry URL pages are reused for, 0 disables cache.
+        self.CACHE_TTL = 0  # Type: int, Default: 0
 
         # Warning, avoid modifying the below options:
         # Location of scraper configuration JSON file directory.
         self.CONFIG_DIRECTORY = 'scrape_configs/'  # Type: str, Default: "scrape_configs/"
         # Directory location to save scraper results to file.
         self.OUTPUT_DIRECTORY = 'output_files/'  # Type: str, Default: "output_files/"
+        # Directory location to store cached entry URL pages.
+        self.CACHE_DIRECTORY = 'page_cache/'  # Type: str, Default: "page_cache/"
+        # How many milliseconds to stagger the start of each entry URL worker.
+        self.WORKER_START_DELAY = 100  # Type: int, Default: 100
 
         # Load settings from settings.yml if it exists, or create it with default settings
         self.load_and_override_settings()
+        self.validate_setting_values()
 
     def get_default_settings(self):
         return {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
     
+    def validate_setting_values(self):
+        if self.SCRAPE_WORKERS < 1:
+            raise SE.BadSettings(f"Setting SCRAPE_WORKERS must be at least 1, but got {self.SCRAPE_WORKERS}.")
+        if self.WORKER_START_DELAY < 0:
+            raise SE.BadSettings(f"Setting WORKER_START_DELAY must not be negative, but got {self.WORKER_START_DELAY}.")
+
     def load_and_override_settings(self):
         settings_yml_path = 'settings.yml'
         default_settings = self.get_default_settings()